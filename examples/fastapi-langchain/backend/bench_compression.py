@@ -0,0 +1,79 @@
+"""
+Benchmark per-frame streaming compression on recorded sessions
+
+For every encoding and level, compresses each recorded stream the same way
+/api/stream does (one context per stream, sync flush after every frame) and
+reports bytes saved and CPU time per stream. Independent per-frame compression
+(a fresh context per frame) is shown for comparison.
+
+    uv run python bench_compression.py recordings.jsonl
+    uv run python bench_compression.py recordings.jsonl --levels 1 6 9 --repeat 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import zlib
+
+from stream_compression import ENCODINGS, compress_stream
+from stream_recording import load_recordings
+
+
+async def frames_of(recording):
+    for _, frame in recording.frames:
+        yield frame
+
+
+async def compress_recording(recording, encoding: str, level: int) -> int:
+    """Compress one recording as a single stream and return the compressed size"""
+    return sum([len(chunk) async for chunk in compress_stream(frames_of(recording), encoding, level)])
+
+
+def compress_frames_independently(recording, encoding: str, level: int) -> int:
+    """Compress every frame with its own context (no shared dictionary)"""
+    size = 0
+    for _, frame in recording.frames:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, ENCODINGS[encoding])
+        size += len(compressor.compress(frame.encode("utf-8")) + compressor.flush())
+    return size
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming compression on recorded sessions")
+    parser.add_argument("recording", help="Recording file produced with STREAM_RECORD_PATH")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9], help="Compression levels to compare")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions per stream")
+    args = parser.parse_args()
+
+    recordings = load_recordings(args.recording)
+    raw_sizes = [sum(len(frame.encode("utf-8")) for _, frame in recording.frames) for recording in recordings]
+    raw_total = sum(raw_sizes)
+    frame_count = sum(len(recording.frames) for recording in recordings)
+    print(f"Streams: {len(recordings)}, frames: {frame_count}, "
+          f"uncompressed: {raw_total:,} bytes ({raw_total / len(recordings):,.0f} per stream)")
+    print()
+    print(f"{'encoding':<9}{'level':>6}{'bytes/stream':>14}{'saved':>8}{'per-frame ctx':>15}{'CPU/stream':>13}")
+
+    for encoding in ENCODINGS:
+        for level in args.levels:
+            sizes = [await compress_recording(recording, encoding, level) for recording in recordings]
+            independent = sum(compress_frames_independently(recording, encoding, level) for recording in recordings)
+
+            cpu_times = []
+            for recording in recordings:
+                start = time.process_time()
+                for _ in range(args.repeat):
+                    await compress_recording(recording, encoding, level)
+                cpu_times.append((time.process_time() - start) / args.repeat)
+
+            total = sum(sizes)
+            print(
+                f"{encoding:<9}{level:>6}{total / len(recordings):>14,.0f}"
+                f"{1 - total / raw_total:>8.1%}{1 - independent / raw_total:>15.1%}"
+                f"{statistics.mean(cpu_times) * 1e6:>10,.0f} µs"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
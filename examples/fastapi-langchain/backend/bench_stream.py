@@ -0,0 +1,142 @@
+"""
+Benchmark /api/stream against recorded sessions
+
+Replays a recording file through the real FastAPI app (in-process, over ASGI)
+and reports time to first frame, total stream time and throughput. No Ollama needed.
+
+Record some sessions first:
+    STREAM_RECORD_PATH=recordings.jsonl uv run uvicorn main:app
+
+Then benchmark:
+    uv run python bench_stream.py recordings.jsonl --speed 0 --iterations 20
+    uv run python bench_stream.py recordings.jsonl --speed 0 --encoding gzip
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import zlib
+from typing import Optional
+
+from stream_compression import ENCODINGS
+
+
+async def run_stream(app, message: str, encoding: Optional[str] = None) -> dict:
+    """Drive one POST /api/stream request through the ASGI app and time it"""
+    body = json.dumps({"message": message, "history": []}).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/stream",
+        "raw_path": b"/api/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"accept", b"text/event-stream"),
+        ] + ([(b"accept-encoding", encoding.encode())] if encoding else []),
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    result = {"status": None, "frames": 0, "bytes": 0, "first_frame": None}
+    decompressor = None
+    start = time.perf_counter()
+
+    async def send(message):
+        nonlocal decompressor
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            headers = dict(message.get("headers", []))
+            content_encoding = headers.get(b"content-encoding", b"").decode()
+            if content_encoding in ENCODINGS:
+                decompressor = zlib.decompressobj(ENCODINGS[content_encoding])
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if chunk:
+                # Bytes are counted on the wire, frames after decoding (a gzip trailer is not a frame)
+                result["bytes"] += len(chunk)
+                text = (decompressor.decompress(chunk) if decompressor else chunk).decode("utf-8")
+                frames = sum(1 for line in text.split("\n") if line.startswith("data:"))
+                if frames and result["first_frame"] is None:
+                    result["first_frame"] = time.perf_counter() - start
+                result["frames"] += frames
+            if not message.get("more_body", False):
+                disconnected.set()
+
+    await app(scope, receive, send)
+    result["total"] = time.perf_counter() - start
+    return result
+
+
+def summarize(label: str, values: list) -> str:
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return (
+        f"{label:<16} mean {statistics.mean(values) * 1000:8.2f} ms   "
+        f"p50 {statistics.median(values) * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/stream with recorded sessions")
+    parser.add_argument("recording", help="Recording file produced with STREAM_RECORD_PATH")
+    parser.add_argument("--speed", type=float, default=0.0, help="Replay speed (1.0 = original, 0 = maximum)")
+    parser.add_argument("--iterations", type=int, default=10, help="Streams to run per recorded session")
+    parser.add_argument("--concurrency", type=int, default=1, help="Streams in flight at once")
+    parser.add_argument("--encoding", choices=["gzip", "deflate"], help="Enable streaming compression with this encoding")
+    args = parser.parse_args()
+
+    os.environ["STREAM_REPLAY_PATH"] = args.recording
+    os.environ["STREAM_REPLAY_SPEED"] = str(args.speed)
+    os.environ.pop("STREAM_RECORD_PATH", None)
+    if args.encoding:
+        os.environ["STREAM_COMPRESSION"] = "1"
+    from main import app, replay_backend
+
+    messages = [recording.message for recording in replay_backend.recordings] * args.iterations
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(message: str) -> dict:
+        async with semaphore:
+            return await run_stream(app, message, args.encoding)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(bounded(message) for message in messages))
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if result["status"] != 200]
+    if failed:
+        print(f"{len(failed)} streams failed (status {failed[0]['status']})", file=sys.stderr)
+        sys.exit(1)
+
+    frames = sum(result["frames"] for result in results)
+    total_bytes = sum(result["bytes"] for result in results)
+    print(f"Streams:         {len(results)} ({len(replay_backend.recordings)} recorded sessions)")
+    print(f"Replay speed:    {'max' if args.speed <= 0 else f'{args.speed}x'}, concurrency {args.concurrency}, "
+          f"encoding {args.encoding or 'identity'}")
+    print(summarize("First frame", [result["first_frame"] for result in results]))
+    print(summarize("Stream total", [result["total"] for result in results]))
+    print(f"Throughput:      {frames / elapsed:,.0f} frames/s, {total_bytes / elapsed / 1024:,.1f} KiB/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
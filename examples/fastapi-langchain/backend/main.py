@@ -20,7 +20,7 @@ Production:
     uv run uvicorn main:app --host 0.0.0.0 --port 8000
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
@@ -31,6 +31,7 @@ import json
 import asyncio
 import time
 import logging
+import os
 import uuid
 from datetime import datetime
 
@@ -42,6 +43,9 @@ from langchain.prompts import PromptTemplate
 from langchain.memory import ConversationBufferMemory
 from langgraph.checkpoint.memory import MemorySaver
 
+from stream_compression import compress_stream, negotiate_encoding
+from stream_recording import ReplayBackend, record_stream
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -65,6 +69,24 @@ if static_dir.exists():
     # Mount static directory for any other static files
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+# Record real /api/stream responses to this file (append-only JSON Lines)
+STREAM_RECORD_PATH = os.getenv("STREAM_RECORD_PATH")
+
+# Serve recorded streams instead of the agent (no Ollama needed)
+# STREAM_REPLAY_SPEED: 1.0 = original pacing, 2.0 = twice as fast, 0 = maximum speed
+STREAM_REPLAY_PATH = os.getenv("STREAM_REPLAY_PATH")
+replay_backend = None
+if STREAM_REPLAY_PATH:
+    replay_backend = ReplayBackend(STREAM_REPLAY_PATH, speed=float(os.getenv("STREAM_REPLAY_SPEED", "1.0")))
+    logger.info(f"✓ Replaying {len(replay_backend.recordings)} recorded streams from {STREAM_REPLAY_PATH}")
+
+# Opt-in per-frame gzip/deflate compression of /api/stream (negotiated via Accept-Encoding)
+STREAM_COMPRESSION = os.getenv("STREAM_COMPRESSION", "").lower() in ("1", "true", "yes")
+STREAM_COMPRESSION_LEVEL = int(os.getenv("STREAM_COMPRESSION_LEVEL", "6"))
+# Fail at startup: once a stream starts, the 200 and Content-Encoding headers are already sent
+if not -1 <= STREAM_COMPRESSION_LEVEL <= 9:
+    raise ValueError(f"STREAM_COMPRESSION_LEVEL must be between -1 and 9, got {STREAM_COMPRESSION_LEVEL}")
+
 # Initialize Ollama with qwen3:8b
 try:
     llm = Ollama(
@@ -409,25 +431,43 @@ async def root():
     return {"message": "Frontend not built. Run 'cd ../frontend && npm run build'"}
 
 @app.post("/api/stream")
-async def stream_chat(request: ChatRequest):
+async def stream_chat(request: ChatRequest, http_request: Request):
     """
     Stream chat responses using LangChain agent with Ollama.
+
+    When STREAM_REPLAY_PATH is set, recorded streams are served instead.
+    When STREAM_RECORD_PATH is set, agent responses are recorded as they stream.
+    When STREAM_COMPRESSION is set, frames are compressed if the client accepts it.
     """
-    if agent_executor is None:
-        raise HTTPException(status_code=500, detail="Agent not initialized. Check server logs.")
-    
-    session_id = request.session_id or str(uuid.uuid4())
+    if replay_backend is not None:
+        frames = replay_backend.stream(request.message)
+    else:
+        if agent_executor is None:
+            raise HTTPException(status_code=500, detail="Agent not initialized. Check server logs.")
+
+        session_id = request.session_id or str(uuid.uuid4())
+        frames = generate_langchain_response(agent_executor, request.message, session_id)
+        if STREAM_RECORD_PATH:
+            frames = record_stream(frames, STREAM_RECORD_PATH, request.message)
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "*",
+    }
+    if STREAM_COMPRESSION:
+        headers["Vary"] = "Accept-Encoding"
+        encoding = negotiate_encoding(http_request.headers.get("accept-encoding"))
+        if encoding:
+            frames = compress_stream(frames, encoding, STREAM_COMPRESSION_LEVEL)
+            headers["Content-Encoding"] = encoding
     
     try:
         return StreamingResponse(
-            generate_langchain_response(agent_executor, request.message, session_id),
+            frames,
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "X-Accel-Buffering": "no",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "*",
-            }
+            headers=headers,
         )
     except Exception as e:
         logger.error(f"Error in stream_chat: {e}")
@@ -0,0 +1,79 @@
+"""
+Per-frame streaming compression for SSE responses
+
+Standard gzip middleware buffers the response, which breaks incremental delivery.
+Here each stream keeps one compressor context and sync-flushes after every frame:
+every frame is decodable by the browser as soon as it arrives, and later frames
+reuse the dictionary built from earlier ones (repeated block JSON compresses well).
+
+Browsers decompress `Content-Encoding: gzip`/`deflate` transparently in fetch(),
+so the frontend needs no changes.
+
+Usage:
+    STREAM_COMPRESSION=1 uv run uvicorn main:app
+    STREAM_COMPRESSION=1 STREAM_COMPRESSION_LEVEL=1 uv run uvicorn main:app
+"""
+
+from typing import AsyncIterator, AsyncGenerator, Optional
+import zlib
+
+# Supported encodings in server preference order, with their zlib wbits
+ENCODINGS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a supported encoding from an Accept-Encoding header.
+
+    Returns None when the client accepts none of them (or refuses them with q=0).
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    candidates = [
+        encoding for encoding in ENCODINGS
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+    if not candidates:
+        return None
+    # Highest client quality wins, server preference breaks ties
+    return max(candidates, key=lambda encoding: accepted.get(encoding, accepted.get("*", 0.0)))
+
+
+async def compress_stream(
+    frames: AsyncIterator[str],
+    encoding: str,
+    level: int = 6,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Compress a frame stream with one context per stream, sync-flushing every frame.
+
+    The wrapped generator is closed as soon as this one is (e.g. on client disconnect),
+    so recording files and agent work are released without waiting for garbage collection.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, ENCODINGS[encoding])
+    try:
+        async for frame in frames:
+            data = frame.encode("utf-8") if isinstance(frame, str) else frame
+            yield compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush(zlib.Z_FINISH)
+    finally:
+        aclose = getattr(frames, "aclose", None)
+        if aclose is not None:
+            await aclose()
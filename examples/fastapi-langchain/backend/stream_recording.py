@@ -0,0 +1,128 @@
+"""
+Record and replay SSE stream sessions
+
+Captures the timed frame sequence of real `/api/stream` responses so they can be
+served back later without Ollama. This gives deterministic throughput and latency
+benchmarks of the transport/UI path.
+
+Recording file format (JSON Lines, append-only, one file holds many streams):
+
+    {"id": "<stream id>", "message": "<user message>", "recorded_at": <unix time>}
+    ["<stream id>", <seconds since stream start>, "data: {...}\\n\\n"]
+    ["<stream id>", <seconds since stream start>, "data: {...}\\n\\n"]
+    ...
+
+Header objects start a stream, frame arrays belong to the stream with the same id.
+Frames of concurrent streams may be interleaved.
+
+Usage:
+    STREAM_RECORD_PATH=recordings.jsonl uv run uvicorn main:app
+    STREAM_REPLAY_PATH=recordings.jsonl STREAM_REPLAY_SPEED=0 uv run uvicorn main:app
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, AsyncGenerator, Dict, Iterator, List, Optional, Tuple, Union
+import asyncio
+import itertools
+import json
+import time
+import uuid
+
+
+@dataclass
+class Recording:
+    """A recorded stream: the user message and its (offset, frame) sequence"""
+    id: str
+    message: str
+    frames: List[Tuple[float, str]] = field(default_factory=list)
+
+
+async def record_stream(
+    frames: AsyncIterator[str],
+    path: Union[str, Path],
+    message: str,
+) -> AsyncGenerator[str, None]:
+    """
+    Pass frames through unchanged while appending them to a recording file.
+
+    Offsets are measured from the moment the response starts streaming.
+    Each line is flushed immediately so an interrupted stream is still replayable.
+    """
+    stream_id = uuid.uuid4().hex[:12]
+    with open(path, "a", encoding="utf-8") as f:
+        header = {"id": stream_id, "message": message, "recorded_at": time.time()}
+        f.write(json.dumps(header, separators=(",", ":")) + "\n")
+        f.flush()
+
+        start = time.perf_counter()
+        async for frame in frames:
+            offset = round(time.perf_counter() - start, 4)
+            f.write(json.dumps([stream_id, offset, frame], separators=(",", ":")) + "\n")
+            f.flush()
+            yield frame
+
+
+def load_recordings(path: Union[str, Path]) -> List[Recording]:
+    """Load all recorded streams from a recording file, in recording order"""
+    recordings: Dict[str, Recording] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, dict):
+                recordings[entry["id"]] = Recording(id=entry["id"], message=entry.get("message", ""))
+            else:
+                stream_id, offset, frame = entry
+                if stream_id in recordings:
+                    recordings[stream_id].frames.append((offset, frame))
+    return [recording for recording in recordings.values() if recording.frames]
+
+
+async def replay_stream(recording: Recording, speed: float = 1.0) -> AsyncGenerator[str, None]:
+    """
+    Replay a recorded stream.
+
+    speed=1.0 reproduces the original pacing, speed=2.0 plays twice as fast,
+    and speed=0 emits every frame as fast as possible.
+    Frames are scheduled against the stream start so sleep overshoot doesn't accumulate.
+    """
+    start = time.perf_counter()
+    for offset, frame in recording.frames:
+        if speed > 0:
+            delay = start + offset / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        yield frame
+
+
+class ReplayBackend:
+    """Serves recorded streams in place of the LangChain agent"""
+
+    def __init__(self, path: Union[str, Path], speed: float = 1.0):
+        self.recordings = load_recordings(path)
+        if not self.recordings:
+            raise ValueError(f"No recorded streams found in {path}")
+        self.speed = speed
+        by_message: Dict[str, List[Recording]] = {}
+        for recording in self.recordings:
+            by_message.setdefault(recording.message, []).append(recording)
+        self._by_message: Dict[str, Iterator[Recording]] = {
+            message: itertools.cycle(recordings) for message, recordings in by_message.items()
+        }
+        self._cycle = itertools.cycle(self.recordings)
+
+    def select(self, message: str) -> Recording:
+        """
+        Pick a recording for an exact message match, otherwise the next one in turn.
+
+        Recordings that share a message are rotated, so each of them gets replayed.
+        """
+        matches = self._by_message.get(message)
+        return next(matches) if matches is not None else next(self._cycle)
+
+    def stream(self, message: str, speed: Optional[float] = None) -> AsyncGenerator[str, None]:
+        """Replay the recording selected for this message"""
+        return replay_stream(self.select(message), self.speed if speed is None else speed)
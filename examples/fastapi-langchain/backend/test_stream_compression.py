@@ -0,0 +1,34 @@
+"""
+Tests for Accept-Encoding negotiation
+
+    uv run --with pytest python -m pytest test_stream_compression.py
+"""
+
+import pytest
+
+from stream_compression import negotiate_encoding
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("", None),
+    ("identity", None),
+    ("br", None),
+    ("gzip, deflate, br", "gzip"),
+    ("deflate", "deflate"),
+    ("deflate;q=0.5, gzip;q=0.2", "deflate"),
+    # q=0 refuses an encoding
+    ("gzip;q=0, identity", None),
+    ("gzip;q=0, deflate", "deflate"),
+    ("gzip; foo=1; q=0", None),
+    ("GZIP;Q=0", None),
+    ("gzip ; q = 0", None),
+    ("gzip;q=0.0, deflate;q=0", None),
+    # Wildcard
+    ("*", "gzip"),
+    ("*;q=0", None),
+    ("*, gzip;q=0", "deflate"),
+    ("deflate;q=0.8, *;q=0.1", "deflate"),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected